@@ -2,41 +2,485 @@
 """
 Import Tour Perret sensor data from JSON log file into TimescaleDB.
 
-This script reads the large JSON log file line by line (each line is a separate JSON object),
-parses the sensor data, and efficiently inserts it into a TimescaleDB hypertable using batch inserts.
+This script splits the large JSON log file (each line is a separate JSON object) into
+chunks, parses them in parallel worker processes, and efficiently loads the sensor data
+into a TimescaleDB hypertable by streaming CSV-encoded rows through PostgreSQL's
+COPY FROM STDIN.
 """
 
+import csv
+import io
 import json
+import os
 import sys
-from datetime import datetime
-from typing import Dict, Any, Optional
-import psycopg2
-from psycopg2.extras import execute_batch
-from psycopg2 import sql
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+import psycopg
+from psycopg import sql
 import argparse
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library
+    orjson = None
+
+if orjson:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+try:
+    import simdjson
+except ImportError:
+    # pysimdjson is optional; records are then fully decoded with json_loads
+    simdjson = None
+
+# One simdjson parser per process: parsers are meant to be reused, and the
+# documents they return are proxies that only convert the keys we read
+_json_parser = simdjson.Parser() if simdjson else None
+
+# UNLOGGED table used by --staging
+STAGING_TABLE = 'sensor_data_stage'
+
+# Load statements, composed once per connection by SensorDataImporter.connect
+COPY_TEMPLATE = """
+    COPY {table} (
+        time, application_name, device_name, dev_eui,
+        dev_latitude, dev_longitude, dev_altitude, dev_place,
+        gateway_id, gateway_latitude, gateway_longitude, gateway_altitude,
+        rssi, lora_snr,
+        frequency, data_rate, adr, frame_counter, f_port,
+        temperature, humidity, dewpoint, vdd,
+        acc_motion, digital, waterleak, pulse_abs,
+        x, y, z,
+        redundancy, topic,
+        raw_data, raw_object
+    ) FROM STDIN WITH (FORMAT CSV, NULL '\\N')
+"""
+
+INSERT_TEMPLATE = """
+    INSERT INTO {table} (
+        time, application_name, device_name, dev_eui,
+        dev_latitude, dev_longitude, dev_altitude, dev_place,
+        gateway_id, gateway_latitude, gateway_longitude, gateway_altitude,
+        rssi, lora_snr,
+        frequency, data_rate, adr, frame_counter, f_port,
+        temperature, humidity, dewpoint, vdd,
+        acc_motion, digital, waterleak, pulse_abs,
+        x, y, z,
+        redundancy, topic,
+        raw_data, raw_object
+    ) VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s
+    )
+"""
+
+# Only every Nth record error is printed, so dirty logs do not flood the output
+WARNING_INTERVAL = 1000
+_warning_count = 0
+
+# Written for None in COPY rows; an unquoted empty field stays an empty string
+CSV_NULL = '\\N'
+
+# Bytes read from the CSV stream per COPY write
+COPY_READ_SIZE = 1 << 16
+
+# Top-level fields of a record, in the order _get_top_level returns them
+TOP_LEVEL_KEYS = (
+    '_date', 'applicationName', 'deviceName', 'devEUI',
+    '_redundancy', '_topic', 'data', 'adr', 'fCnt', 'fPort',
+)
+_get_top_level = itemgetter(*TOP_LEVEL_KEYS)
+
+# Shared defaults for missing sub-objects, so no literal is built per line.
+# They are only ever read, never mutated.
+_EMPTY_OBJECT = {}
+_NO_RX_INFO = (_EMPTY_OBJECT,)
+
+
+def _as_dict(obj) -> dict:
+    """
+    Return a JSON object as a plain dict.
+    
+    simdjson proxies pay for an internal exception on every missing key, so
+    objects where keys are likely to be missing are materialized once instead.
+    """
+    return obj if isinstance(obj, dict) else obj.as_dict()
+
+
+def _warn(message: str, error: Exception):
+    """Print a record error, rate-limited to one message every WARNING_INTERVAL errors."""
+    global _warning_count
+    _warning_count += 1
+    if _warning_count % WARNING_INTERVAL == 1:
+        print(f"⚠ Warning: {message}: {error} ({_warning_count:,} record error(s) in this process)")
+
+
+@lru_cache(maxsize=4096)
+def _dumps_items(items: tuple) -> str:
+    """
+    Serialize the (key, type, value) triples of a flat JSON object.
+    
+    The type is part of the cache key because 1, 1.0 and True compare and
+    hash equal but serialize differently.
+    """
+    return json_dumps({key: value for key, _, value in items})
+
+
+def dumps_sensor_object(sensor_obj: dict) -> str:
+    """
+    Serialize a sensor object for the raw_object JSONB column.
+    
+    Readings from low-entropy sensors repeat a lot, so with the standard json
+    module identical objects reuse a cached string. orjson serializes faster
+    than the cache lookup costs, so it is always called directly.
+    
+    Args:
+        sensor_obj: Decoded 'object' field of a record
+        
+    Returns:
+        JSON text of the object
+    """
+    if orjson:
+        return json_dumps(sensor_obj)
+    try:
+        return _dumps_items(tuple((key, type(value), value) for key, value in sensor_obj.items()))
+    except TypeError:
+        # Nested lists or objects are not hashable
+        return json_dumps(sensor_obj)
+
+
+@lru_cache(maxsize=256)
+def _utc_second(seconds: int) -> str:
+    """Format whole epoch seconds as an ISO 8601 UTC date and time."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+
+
+def epoch_ms_to_iso(epoch_ms: int) -> str:
+    """
+    Format an epoch timestamp in milliseconds as an ISO 8601 UTC string.
+    
+    Redundant receptions of a frame share the same second, so the formatted
+    second is cached and only the milliseconds are appended per record.
+    
+    Args:
+        epoch_ms: Milliseconds since the Unix epoch
+        
+    Returns:
+        Timestamp such as '2022-01-20T10:00:00.123+00:00'
+    """
+    seconds, millis = divmod(int(epoch_ms), 1000)
+    return f"{_utc_second(seconds)}.{millis:03d}+00:00"
+
+
+def parse_sensor_record(line: bytes) -> Optional[tuple]:
+    """
+    Parse a JSON line from the log file and extract sensor data.
+    
+    Args:
+        line: Raw JSON line (bytes) from log file
+        
+    Returns:
+        Tuple of values for database insertion, or None if parsing fails
+    """
+    try:
+        if _json_parser:
+            data = _json_parser.parse(line)
+        else:
+            data = json_loads(line)
+        
+        # Complete records take a single itemgetter call; the slower
+        # per-key lookup only runs when a field is missing
+        try:
+            top_level = _get_top_level(data)
+        except KeyError:
+            data = _as_dict(data)
+            top_level = tuple(map(data.get, TOP_LEVEL_KEYS))
+        (timestamp, application_name, device_name, dev_eui,
+         redundancy, topic, raw_data, adr, frame_counter, f_port) = top_level
+        
+        # Bound .get methods: one attribute lookup per object instead of one per field
+        g = data.get
+        
+        # Parse timestamp
+        if not timestamp:
+            timestamp = epoch_ms_to_iso(g('_timestamp', 0))
+        
+        # Device location
+        dg = _as_dict(g('_devLocation', _EMPTY_OBJECT)).get
+        
+        # Gateway info (use first gateway if multiple)
+        rx_info = _as_dict((g('rxInfo') or _NO_RX_INFO)[0])
+        rg = rx_info.get
+        gg = rg('location', _EMPTY_OBJECT).get
+        
+        # Transmission info
+        tg = _as_dict(g('txInfo', _EMPTY_OBJECT)).get
+        
+        # Sensor readings from object field
+        sensor_obj = g('object', _EMPTY_OBJECT)
+        if isinstance(sensor_obj, dict):
+            raw_object = dumps_sensor_object(sensor_obj)
+        else:
+            # simdjson keeps the original bytes, no need to re-serialize
+            raw_object = sensor_obj.mini.decode('utf-8')
+            sensor_obj = sensor_obj.as_dict()
+        sg = sensor_obj.get
+        
+        return (
+            timestamp,  # time
+            application_name,
+            device_name,
+            dev_eui,
+            dg('latitude'),
+            dg('longitude'),
+            dg('altitude'),
+            dg('place'),
+            
+            # Gateway info
+            rg('gatewayID'),
+            gg('latitude'),
+            gg('longitude'),
+            gg('altitude'),
+            rg('rssi'),
+            rg('loRaSNR'),
+            
+            # Transmission
+            tg('frequency'),
+            tg('dr'),
+            adr,
+            frame_counter,
+            f_port,
+            
+            # Sensor readings
+            sg('temperature'),
+            sg('humidity'),
+            sg('dewpoint'),
+            sg('vdd'),
+            sg('accMotion'),
+            sg('digital'),
+            sg('waterleak'),
+            sg('pulseAbs'),
+            sg('x'),
+            sg('y'),
+            sg('z'),
+            
+            # Metadata
+            redundancy,
+            topic,
+            
+            # Raw data
+            raw_data,
+            raw_object  # Store object as JSONB
+        )
+    except ValueError as e:
+        _warn("Failed to parse JSON", e)
+        return None
+    except Exception as e:
+        _warn("Error processing record", e)
+        return None
+
+
+def split_file(log_file_path: Path, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Split a log file into byte ranges of roughly chunk_size that end on a line boundary.
+    
+    Args:
+        log_file_path: Path to the JSON log file
+        chunk_size: Target size in bytes of each range
+        
+    Yields:
+        (start, end) byte offsets of each range
+    """
+    file_size = log_file_path.stat().st_size
+    with open(log_file_path, 'rb') as f:
+        start = 0
+        while start < file_size:
+            f.seek(min(start + chunk_size, file_size))
+            f.readline()  # Advance to the end of the current line
+            end = f.tell()
+            yield start, end
+            start = end
+
+
+def read_chunk(log_file_path: Path, start: int, end: int) -> List[bytes]:
+    """
+    Read one byte range of the log file as a list of raw lines.
+    
+    Args:
+        log_file_path: Path to the JSON log file
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        
+    Returns:
+        Lines of the range, without line terminators
+    """
+    with open(log_file_path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).splitlines()
+
+
+def parse_lines(lines: List[bytes], counts: Counter) -> Iterator[tuple]:
+    """
+    Lazily parse log lines into records.
+    
+    Args:
+        lines: Raw JSON lines
+        counts: Counter updated with 'imported' and 'errors' as lines are consumed
+        
+    Yields:
+        Tuple of values for database insertion, for each valid line
+    """
+    for line in lines:
+        if line.strip():
+            record = parse_sensor_record(line)
+            if record:
+                counts['imported'] += 1
+                yield record
+            else:
+                counts['errors'] += 1
+
+
+class _CsvLineEncoder:
+    """File-like target for csv.writer that hands each line back encoded."""
+    
+    def write(self, line: str) -> bytes:
+        return line.encode('utf-8')
+
+
+def iter_csv_rows(records: Iterable[tuple]) -> Iterator[bytes]:
+    """
+    Encode records as CSV lines for COPY ... WITH (FORMAT CSV, NULL '\\N').
+    
+    None is written as CSV_NULL so that COPY reads it as NULL while empty
+    strings are kept as empty strings, matching the INSERT fallback.
+    
+    Args:
+        records: Tuples of values for database insertion
+        
+    Yields:
+        One UTF-8 encoded CSV line per record
+    """
+    # writerow() returns whatever the target's write() returned for the line
+    writer = csv.writer(_CsvLineEncoder(), quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+    for record in records:
+        yield writer.writerow([CSV_NULL if value is None else value for value in record])
+
+
+class RowStream(io.RawIOBase):
+    """
+    Read-only binary stream over an iterator of byte strings.
+    
+    Lets COPY pull rows straight from a generator at its own pace, so the
+    rows are never assembled into one buffer first.
+    """
+    
+    def __init__(self, rows: Iterator[bytes]):
+        self.rows = rows
+        self.pending = bytearray()
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        size = len(buffer)
+        while len(self.pending) < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            self.pending += row
+        
+        n = min(size, len(self.pending))
+        buffer[:n] = self.pending[:n]
+        del self.pending[:n]
+        return n
+
+
+def parse_chunk(log_file_path: Path, start: int, end: int,
+                as_csv: bool = True) -> Tuple[Union[bytes, List[tuple]], Counter]:
+    """
+    Parse one byte range of the log file into rows ready for the database.
+    
+    Runs in a worker process. For COPY it returns the encoded CSV rows as one
+    bytes object rather than the parsed tuples to keep pickling cheap.
+    
+    Args:
+        log_file_path: Path to the JSON log file
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        as_csv: Return the rows as CSV for COPY if True, as tuples otherwise
+        
+    Returns:
+        Tuple of (rows, counts), counts holding 'lines', 'imported' and 'errors'
+    """
+    lines = read_chunk(log_file_path, start, end)
+    counts = Counter(lines=len(lines))
+    records = parse_lines(lines, counts)
+    
+    if as_csv:
+        return b''.join(iter_csv_rows(records)), counts
+    
+    # Every line yields at most one record, so the list is sized once up front
+    rows = [None] * len(lines)
+    for i, record in enumerate(records):
+        rows[i] = record
+    del rows[counts['imported']:]
+    return rows, counts
+
 
 class SensorDataImporter:
-    def __init__(self, db_config: Dict[str, str], batch_size: int = 1000):
+    def __init__(self, db_config: Dict[str, str], chunk_size: int = 64 * 1024 * 1024,
+                 workers: Optional[int] = None, method: str = 'copy',
+                 batch_size: int = 10000, defer_indexes: bool = False,
+                 staging: bool = False):
         """
         Initialize the importer.
         
         Args:
             db_config: Database connection configuration
-            batch_size: Number of records to insert in one batch
+            chunk_size: Size in bytes of the log chunk parsed by a worker and loaded in one transaction
+            workers: Number of parser processes (defaults to the number of CPUs)
+            method: 'copy' to load with COPY FROM STDIN, 'values' to fall back to pipelined INSERTs
+            batch_size: Number of records sent per pipeline sync with the 'values' method
+            defer_indexes: Drop the sensor_data indexes during the import and rebuild them afterwards
+            staging: Load into an UNLOGGED staging table, then move the rows into sensor_data
         """
         self.db_config = db_config
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.method = method
         self.batch_size = batch_size
+        self.defer_indexes = defer_indexes
+        self.staging = staging
         self.conn = None
         self.cursor = None
+        self.copy_sql = None
+        self.insert_sql = None
         
     def connect(self):
-        """Establish database connection."""
+        """Establish database connection and compose the load statements."""
         try:
-            self.conn = psycopg2.connect(**self.db_config)
+            self.conn = psycopg.connect(**self.db_config)
             self.cursor = self.conn.cursor()
             print(f"✓ Connected to database: {self.db_config['dbname']}")
+            
+            # With staging, rows land in an UNLOGGED table first and skip the WAL
+            target_table = sql.Identifier(STAGING_TABLE if self.staging else 'sensor_data')
+            self.copy_sql = sql.SQL(COPY_TEMPLATE).format(table=target_table).as_string(self.conn)
+            self.insert_sql = sql.SQL(INSERT_TEMPLATE).format(table=target_table).as_string(self.conn)
         except Exception as e:
             print(f"✗ Failed to connect to database: {e}")
             sys.exit(1)
@@ -49,90 +493,6 @@ class SensorDataImporter:
             self.conn.close()
             print("✓ Database connection closed")
     
-    def parse_sensor_record(self, line: str) -> Optional[tuple]:
-        """
-        Parse a JSON line from the log file and extract sensor data.
-        
-        Args:
-            line: JSON string from log file
-            
-        Returns:
-            Tuple of values for database insertion, or None if parsing fails
-        """
-        try:
-            data = json.loads(line.strip())
-            
-            # Parse timestamp
-            timestamp = data.get('_date')
-            if not timestamp:
-                timestamp = datetime.fromtimestamp(data.get('_timestamp', 0) / 1000).isoformat()
-            
-            # Device location
-            dev_location = data.get('_devLocation', {})
-            
-            # Gateway info (use first gateway if multiple)
-            rx_info = data.get('rxInfo', [{}])[0]
-            gateway_location = rx_info.get('location', {})
-            
-            # Transmission info
-            tx_info = data.get('txInfo', {})
-            
-            # Sensor readings from object field
-            sensor_obj = data.get('object', {})
-            
-            return (
-                timestamp,  # time
-                data.get('applicationName'),
-                data.get('deviceName'),
-                data.get('devEUI'),
-                dev_location.get('latitude'),
-                dev_location.get('longitude'),
-                dev_location.get('altitude'),
-                dev_location.get('place'),
-                
-                # Gateway info
-                rx_info.get('gatewayID'),
-                gateway_location.get('latitude'),
-                gateway_location.get('longitude'),
-                gateway_location.get('altitude'),
-                rx_info.get('rssi'),
-                rx_info.get('loRaSNR'),
-                
-                # Transmission
-                tx_info.get('frequency'),
-                tx_info.get('dr'),
-                data.get('adr'),
-                data.get('fCnt'),
-                data.get('fPort'),
-                
-                # Sensor readings
-                sensor_obj.get('temperature'),
-                sensor_obj.get('humidity'),
-                sensor_obj.get('dewpoint'),
-                sensor_obj.get('vdd'),
-                sensor_obj.get('accMotion'),
-                sensor_obj.get('digital'),
-                sensor_obj.get('waterleak'),
-                sensor_obj.get('pulseAbs'),
-                sensor_obj.get('x'),
-                sensor_obj.get('y'),
-                sensor_obj.get('z'),
-                
-                # Metadata
-                data.get('_redundancy'),
-                data.get('_topic'),
-                
-                # Raw data
-                data.get('data'),
-                json.dumps(sensor_obj)  # Store object as JSONB
-            )
-        except json.JSONDecodeError as e:
-            print(f"⚠ Warning: Failed to parse JSON: {e}")
-            return None
-        except Exception as e:
-            print(f"⚠ Warning: Error processing record: {e}")
-            return None
-    
     def import_data(self, log_file_path: Path, skip_errors: bool = True):
         """
         Import data from log file into database.
@@ -145,77 +505,52 @@ class SensorDataImporter:
             print(f"✗ Error: File not found: {log_file_path}")
             sys.exit(1)
         
-        insert_query = """
-            INSERT INTO sensor_data (
-                time, application_name, device_name, dev_eui,
-                dev_latitude, dev_longitude, dev_altitude, dev_place,
-                gateway_id, gateway_latitude, gateway_longitude, gateway_altitude,
-                rssi, lora_snr,
-                frequency, data_rate, adr, frame_counter, f_port,
-                temperature, humidity, dewpoint, vdd,
-                acc_motion, digital, waterleak, pulse_abs,
-                x, y, z,
-                redundancy, topic,
-                raw_data, raw_object
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s
-            )
-        """
-        
-        batch = []
         total_lines = 0
         imported_lines = 0
         error_count = 0
         
         print(f"\n📖 Reading file: {log_file_path}")
-        print(f"📦 Batch size: {self.batch_size}")
-        print(f"⚙️  Processing...\n")
+        print(f"📦 Chunk size: {self.chunk_size / (1024 * 1024):.0f} MB")
+        if self.method == 'copy':
+            print(f"🚚 Load method: COPY")
+        else:
+            print(f"🚚 Load method: pipelined INSERT, {self.batch_size:,} records per sync")
+        print(f"🧵 Parser workers: {self.workers}")
+        
+        index_definitions = self.drop_indexes() if self.defer_indexes else []
         
         try:
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    total_lines += 1
-                    
-                    if line.strip():
-                        record = self.parse_sensor_record(line)
-                        if record:
-                            batch.append(record)
-                            imported_lines += 1
-                        else:
-                            error_count += 1
-                    
-                    # Insert batch when it reaches batch_size
-                    if len(batch) >= self.batch_size:
-                        try:
-                            execute_batch(self.cursor, insert_query, batch, page_size=self.batch_size)
-                            self.conn.commit()
-                            print(f"  ✓ Inserted batch: {imported_lines:,} records imported so far...")
-                            batch = []
-                        except Exception as e:
-                            print(f"  ✗ Error inserting batch: {e}")
-                            self.conn.rollback()
-                            if not skip_errors:
-                                raise
-                            batch = []
-                    
-                    # Progress indicator every 10,000 lines
-                    if line_num % 10000 == 0:
-                        print(f"  📊 Processed {line_num:,} lines ({imported_lines:,} imported, {error_count:,} errors)")
+            # Inside the try so that dropped indexes are restored if this fails
+            if self.staging:
+                self.create_staging_table()
+            
+            print(f"⚙️  Processing...\n")
+            
+            for rows, counts in self.iter_chunks(log_file_path):
+                try:
+                    if self.method == 'copy':
+                        self.copy_rows(rows)
+                    elif rows:
+                        self.insert_rows(rows)
+                    loaded = True
+                except Exception as e:
+                    print(f"  ✗ Error loading chunk: {e}")
+                    self.conn.rollback()
+                    if not skip_errors:
+                        raise
+                    loaded = False
+                
+                # Streamed chunks are only fully counted once COPY has consumed them
+                total_lines += counts['lines']
+                imported_lines += counts['imported']
+                error_count += counts['errors']
                 
-                # Insert remaining records
-                if batch:
-                    try:
-                        execute_batch(self.cursor, insert_query, batch, page_size=len(batch))
-                        self.conn.commit()
-                        print(f"  ✓ Inserted final batch: {imported_lines:,} records")
-                    except Exception as e:
-                        print(f"  ✗ Error inserting final batch: {e}")
-                        self.conn.rollback()
-                        if not skip_errors:
-                            raise
+                if loaded:
+                    print(f"  ✓ Loaded chunk: {imported_lines:,} records imported so far...")
+                print(f"  📊 Processed {total_lines:,} lines ({imported_lines:,} imported, {error_count:,} errors)")
+            
+            if self.staging:
+                self.merge_staging_table()
             
             print(f"\n" + "="*60)
             print(f"📊 Import Summary:")
@@ -225,9 +560,6 @@ class SensorDataImporter:
             print(f"  Success rate:         {(imported_lines/total_lines*100):.2f}%")
             print("="*60)
             
-            # Display some statistics
-            self.show_statistics()
-            
         except KeyboardInterrupt:
             print("\n\n⚠ Import interrupted by user")
             self.conn.rollback()
@@ -236,6 +568,165 @@ class SensorDataImporter:
             print(f"\n✗ Fatal error during import: {e}")
             self.conn.rollback()
             raise
+        finally:
+            # Indexes are rebuilt even if the import failed or was interrupted
+            if index_definitions:
+                self.restore_indexes(index_definitions)
+        
+        # Display some statistics
+        self.show_statistics()
+    
+    def create_staging_table(self):
+        """Create an empty UNLOGGED copy of sensor_data for the bulk load."""
+        self.cursor.execute(sql.SQL("""
+            CREATE UNLOGGED TABLE IF NOT EXISTS {} (LIKE sensor_data INCLUDING DEFAULTS)
+        """).format(sql.Identifier(STAGING_TABLE)))
+        # Left over by an interrupted import
+        self.cursor.execute(sql.SQL("TRUNCATE {}").format(sql.Identifier(STAGING_TABLE)))
+        self.conn.commit()
+        print(f"🗃  Staging rows in UNLOGGED table {STAGING_TABLE}")
+    
+    def merge_staging_table(self):
+        """Move the staged rows into sensor_data in one transaction and drop the staging table."""
+        print(f"\n🗃  Moving staged rows into sensor_data...")
+        try:
+            self.cursor.execute(sql.SQL("INSERT INTO sensor_data SELECT * FROM {}").format(
+                sql.Identifier(STAGING_TABLE)))
+            moved = self.cursor.rowcount
+            self.cursor.execute(sql.SQL("DROP TABLE {}").format(sql.Identifier(STAGING_TABLE)))
+            self.conn.commit()
+            print(f"  ✓ Moved {moved:,} records")
+        except Exception as e:
+            print(f"  ✗ Error moving staged rows, they are kept in {STAGING_TABLE}: {e}")
+            self.conn.rollback()
+            raise
+    
+    def drop_indexes(self) -> List[str]:
+        """
+        Drop the secondary indexes of sensor_data before a bulk load.
+        
+        Triggers are left enabled: TimescaleDB relies on them to track
+        changes for the continuous aggregates.
+        
+        Returns:
+            CREATE INDEX statements to restore them with restore_indexes
+        """
+        self.cursor.execute("""
+            SELECT indexname, indexdef
+            FROM pg_indexes
+            WHERE schemaname = current_schema()
+              AND tablename = 'sensor_data'
+              AND indexname NOT LIKE '%pkey'
+        """)
+        indexes = self.cursor.fetchall()
+        
+        for index_name, _ in indexes:
+            self.cursor.execute(sql.SQL("DROP INDEX {}").format(sql.Identifier(index_name)))
+        self.conn.commit()
+        
+        print(f"🗂  Dropped {len(indexes)} index(es) for the duration of the import")
+        return [index_definition for _, index_definition in indexes]
+    
+    def restore_indexes(self, index_definitions: List[str]):
+        """
+        Recreate the indexes dropped by drop_indexes.
+        
+        Args:
+            index_definitions: CREATE INDEX statements returned by drop_indexes
+        
+        Raises:
+            RuntimeError: If any index could not be recreated
+        """
+        print(f"\n🗂  Rebuilding {len(index_definitions)} index(es)...")
+        failed = []
+        for index_definition in index_definitions:
+            try:
+                self.cursor.execute(index_definition)
+                self.conn.commit()
+            except Exception as e:
+                print(f"  ✗ Error rebuilding index, run it manually: {index_definition}")
+                print(f"    {e}")
+                self.conn.rollback()
+                failed.append(index_definition)
+        
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(index_definitions)} index(es) could not be rebuilt")
+        print("✓ Indexes rebuilt")
+    
+    def iter_chunks(self, log_file_path: Path) -> Iterator[Tuple[Union[BinaryIO, List[tuple]], Counter]]:
+        """
+        Parse the log file chunk by chunk, in parallel when several workers are configured.
+        
+        At most two chunks per worker are in flight, so memory stays bounded while
+        the main process is busy copying. With a single worker, COPY rows are
+        parsed lazily as the database reads them.
+        
+        Args:
+            log_file_path: Path to the JSON log file
+            
+        Yields:
+            Tuple of (rows, counts) in file order; rows is a binary CSV stream
+            for COPY, a list of tuples otherwise
+        """
+        chunks = split_file(log_file_path, self.chunk_size)
+        as_csv = self.method == 'copy'
+        
+        if self.workers == 1:
+            for start, end in chunks:
+                if as_csv:
+                    lines = read_chunk(log_file_path, start, end)
+                    counts = Counter(lines=len(lines))
+                    yield RowStream(iter_csv_rows(parse_lines(lines, counts))), counts
+                else:
+                    yield parse_chunk(log_file_path, start, end, as_csv)
+            return
+        
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            pending = deque()
+            for start, end in chunks:
+                pending.append(executor.submit(parse_chunk, log_file_path, start, end, as_csv))
+                if len(pending) >= 2 * self.workers:
+                    yield self._chunk_result(pending.popleft(), as_csv)
+            while pending:
+                yield self._chunk_result(pending.popleft(), as_csv)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    @staticmethod
+    def _chunk_result(future, as_csv: bool) -> Tuple[Union[BinaryIO, List[tuple]], Counter]:
+        """Wait for a parse_chunk future, wrapping CSV bytes in a stream for COPY."""
+        rows, counts = future.result()
+        return (io.BytesIO(rows) if as_csv else rows), counts
+    
+    def copy_rows(self, stream: BinaryIO):
+        """
+        Send CSV rows to the database with COPY and commit.
+        
+        Args:
+            stream: Binary CSV stream from iter_chunks
+        """
+        with self.cursor.copy(self.copy_sql) as copy:
+            while data := stream.read(COPY_READ_SIZE):
+                copy.write(data)
+        self.conn.commit()
+    
+    def insert_rows(self, records: List[tuple]):
+        """
+        Insert records with pipelined INSERT statements and commit.
+        
+        Fallback for setups where COPY cannot be used. In pipeline mode the
+        statements are sent without waiting for each result; the client only
+        waits for the server once every batch_size records.
+        
+        Args:
+            records: Parsed records produced by parse_chunk
+        """
+        with self.conn.pipeline() as pipeline:
+            for start in range(0, len(records), self.batch_size):
+                self.cursor.executemany(self.insert_sql, records[start:start + self.batch_size])
+                pipeline.sync()
+        self.conn.commit()
     
     def show_statistics(self):
         """Display database statistics after import."""
@@ -315,11 +806,44 @@ def main():
         help='Database password'
     )
     
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=64,
+        help='Size in MB of the log chunk parsed per worker and sent per COPY'
+    )
+    
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of parser processes'
+    )
+    
+    parser.add_argument(
+        '--method',
+        choices=['copy', 'values'],
+        default='copy',
+        help='Load with COPY, or fall back to pipelined INSERT ... VALUES'
+    )
+    
     parser.add_argument(
         '--batch-size',
         type=int,
-        default=1000,
-        help='Number of records per batch insert'
+        default=10000,
+        help='Number of records sent per pipeline sync with --method values'
+    )
+    
+    parser.add_argument(
+        '--defer-indexes',
+        action='store_true',
+        help='Drop sensor_data indexes during the import and rebuild them afterwards'
+    )
+    
+    parser.add_argument(
+        '--staging',
+        action='store_true',
+        help='Load into an UNLOGGED staging table first, then move the rows into sensor_data'
     )
     
     parser.add_argument(
@@ -344,7 +868,15 @@ def main():
     print("="*60)
     
     # Create importer and run
-    importer = SensorDataImporter(db_config, batch_size=args.batch_size)
+    importer = SensorDataImporter(
+        db_config,
+        chunk_size=args.chunk_size * 1024 * 1024,
+        workers=args.workers,
+        method=args.method,
+        batch_size=args.batch_size,
+        defer_indexes=args.defer_indexes,
+        staging=args.staging
+    )
     
     try:
         importer.connect()
@@ -2,12 +2,20 @@
 """
 Visualize Tour Perret Gateways on a Map
 Displays all gateways and their geolocations using Folium
+
+On large tables, the gateway query can be answered by an index-only scan
+with this partial index (it only covers the columns the query reads):
+
+    CREATE INDEX idx_sensor_gateway_location ON sensor_data
+        (gateway_latitude, gateway_longitude, gateway_id)
+        WHERE gateway_latitude IS NOT NULL AND gateway_longitude IS NOT NULL;
 """
 
 import psycopg2
 import folium
 from folium import plugins
 import os
+from collections import defaultdict
 
 # Database connection parameters
 DB_CONFIG = {
@@ -19,26 +27,32 @@ DB_CONFIG = {
 }
 
 def get_gateways():
-    """Retrieve all unique gateways with their coordinates from the database"""
+    """Retrieve all unique gateway locations with their gateway IDs, grouped by the database"""
     conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
+    # Server-side cursor: rows are transferred in batches of itersize. After the
+    # GROUP BY there is one row per gateway location, so the result is small and
+    # is kept in memory; create_map needs several passes over it anyway
+    cur = conn.cursor(name='gateway_stream')
+    cur.itersize = 10000
     
     query = """
-        SELECT DISTINCT 
-            gateway_id, 
+        SELECT 
             gateway_latitude, 
-            gateway_longitude
+            gateway_longitude,
+            array_agg(DISTINCT gateway_id) AS gateway_ids
         FROM sensor_data
         WHERE gateway_latitude IS NOT NULL 
           AND gateway_longitude IS NOT NULL
-        ORDER BY gateway_id;
+        GROUP BY gateway_latitude, gateway_longitude
     """
     
-    cur.execute(query)
-    results = cur.fetchall()
-    
-    cur.close()
-    conn.close()
+    try:
+        cur.execute(query)
+        # Iterating (unlike fetchall on a named cursor) honours itersize
+        results = list(cur)
+    finally:
+        cur.close()
+        conn.close()
     
     return results
 
@@ -46,10 +60,9 @@ def create_map(gateways):
     """Create an interactive map with all gateways"""
     
     # Calculate center of all gateways
-    lats = [g[1] for g in gateways]
-    lons = [g[2] for g in gateways]
-    center_lat = sum(lats) / len(lats)
-    center_lon = sum(lons) / len(lons)
+    gateway_count = sum(len(gateway_ids) for _, _, gateway_ids in gateways)
+    center_lat = sum(lat * len(gateway_ids) for lat, _, gateway_ids in gateways) / gateway_count
+    center_lon = sum(lon * len(gateway_ids) for _, lon, gateway_ids in gateways) / gateway_count
     
     # Create base map
     m = folium.Map(
@@ -58,24 +71,16 @@ def create_map(gateways):
         tiles='OpenStreetMap'
     )
     
-    # Track unique gateway locations (some gateways might have multiple locations)
-    gateway_locations = {}
-    
-    for gateway_id, lat, lon in gateways:
-        location_key = f"{lat:.6f},{lon:.6f}"
-        
-        if location_key not in gateway_locations:
-            gateway_locations[location_key] = []
-        
-        gateway_locations[location_key].append(gateway_id)
+    # Gateways layer, toggled from the layer control, clustered for better visualization
+    gateway_layer = folium.FeatureGroup(name='Gateways').add_to(m)
+    marker_cluster = plugins.MarkerCluster().add_to(gateway_layer)
     
-    # Add markers for each unique location
-    for location_key, gateway_ids in gateway_locations.items():
-        lat, lon = map(float, location_key.split(','))
-        
+    # Add one marker for each unique location
+    # (rows come back unsorted, marker order does not matter on the map)
+    for lat, lon, gateway_ids in gateways:
         # Create popup text
         popup_text = f"<b>Location:</b> {lat:.6f}, {lon:.6f}<br>"
-        popup_text += f"<b>Gateway(s):</b><br>"
+        popup_text += f"<b>{len(gateway_ids)} Gateway(s):</b><br>"
         for gw_id in gateway_ids:
             popup_text += f"<small>{gw_id}</small><br>"
         
@@ -84,20 +89,6 @@ def create_map(gateways):
             location=[lat, lon],
             popup=folium.Popup(popup_text, max_width=300),
             tooltip=f"{len(gateway_ids)} gateway(s)",
-            icon=folium.Icon(color='red', icon='signal', prefix='fa')
-        ).add_to(m)
-    
-    # Add marker cluster for better visualization
-    marker_cluster = plugins.MarkerCluster().add_to(m)
-    
-    for location_key, gateway_ids in gateway_locations.items():
-        lat, lon = map(float, location_key.split(','))
-        popup_text = f"<b>Location:</b> {lat:.6f}, {lon:.6f}<br>"
-        popup_text += f"<b>{len(gateway_ids)} Gateway(s)</b>"
-        
-        folium.Marker(
-            location=[lat, lon],
-            popup=folium.Popup(popup_text, max_width=300),
             icon=folium.Icon(color='blue', icon='broadcast-tower', prefix='fa')
         ).add_to(marker_cluster)
     
@@ -114,32 +105,29 @@ def main():
     
     try:
         gateways = get_gateways()
-        print(f"Found {len(gateways)} gateway records")
+        print(f"Found {sum(len(g[2]) for g in gateways)} gateway records")
         
-        # Count unique locations
-        unique_locations = set((g[1], g[2]) for g in gateways)
-        print(f"Found {len(unique_locations)} unique gateway locations")
+        # Rows are already unique locations
+        print(f"Found {len(gateways)} unique gateway locations")
+        
+        # Group by gateway ID
+        gateway_dict = defaultdict(list)
+        for lat, lon, gateway_ids in gateways:
+            for gw_id in gateway_ids:
+                gateway_dict[gw_id].append((lat, lon))
         
         # Count unique gateway IDs
-        unique_gateways = set(g[0] for g in gateways)
-        print(f"Found {len(unique_gateways)} unique gateway IDs")
+        print(f"Found {len(gateway_dict)} unique gateway IDs")
         
         print("\nGateway details:")
         print("-" * 80)
         
-        # Group by gateway ID
-        gateway_dict = {}
-        for gw_id, lat, lon in gateways:
-            if gw_id not in gateway_dict:
-                gateway_dict[gw_id] = []
-            gateway_dict[gw_id].append((lat, lon))
-        
         for gw_id in sorted(gateway_dict.keys()):
             locations = gateway_dict[gw_id]
             print(f"\nGateway: {gw_id}")
             if len(locations) > 1:
                 print(f"  Multiple locations ({len(locations)}):")
-                for lat, lon in locations:
+                for lat, lon in sorted(locations):
                     print(f"    - {lat:.6f}, {lon:.6f}")
             else:
                 lat, lon = locations[0]